@@ -0,0 +1,140 @@
+"""
+TCDE Complete Validation - Directory Listing Cache
+Date: October 15, 2026
+Protocol: Zero Tolerance v3.0
+
+Remembers directory listings across runs, keyed by (path, st_mtime_ns,
+st_ctime_ns). Adding, removing or renaming an entry bumps the directory mtime;
+tools that restore an mtime (tar, rsync -a, touch -r) still bump the ctime,
+which cannot be set from userspace. A cached listing is therefore reused only
+while it is still exact. Callers may attach a set of patterns known to match
+nothing in a listing; it lives and dies with it.
+"""
+
+import atexit
+import json
+import os
+import time
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Set
+
+CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "tcde_validation", "dirs.json"
+)
+
+# Listings of directories modified this recently are not persisted: a change
+# within the same mtime tick would otherwise go unnoticed on the next run
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Most recently used listings kept on save; older ones are dropped
+_MAX_ENTRIES = 256
+
+# path -> {"mtime_ns": int, "ctime_ns": int, "entries": {name: is_file},
+#          "misses": [pattern]}
+_cache: Optional[Dict[str, Dict[str, Any]]] = None
+_dirty = False
+# Paths whose cached record was validated against the directory this run
+_current: Set[str] = set()
+
+def _load() -> Dict[str, Dict[str, Any]]:
+    """Load the persisted cache once per process"""
+    global _cache
+    if _cache is None:
+        _cache = {}
+        try:
+            with open(CACHE_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = None
+        if isinstance(data, dict):
+            for path, record in data.items():
+                if (isinstance(record, dict)
+                        and isinstance(record.get("mtime_ns"), int)
+                        and isinstance(record.get("ctime_ns"), int)
+                        and isinstance(record.get("entries"), dict)
+                        and isinstance(record.get("misses", []), list)):
+                    _cache[path] = {
+                        "mtime_ns": record["mtime_ns"],
+                        "ctime_ns": record["ctime_ns"],
+                        "entries": record["entries"],
+                        "misses": record.get("misses", [])
+                    }
+        atexit.register(_save)
+    return _cache
+
+def _save():
+    """Persist the cache if any listing or the usage order changed"""
+    if not _dirty:
+        return
+    # Drop directories that no longer exist, then keep the most recent ones
+    live = [(path, record) for path, record in _cache.items()
+            if os.path.isdir(path)]
+    data = dict(live[-_MAX_ENTRIES:])
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        tmp_path = f"{CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, CACHE_PATH)
+    except OSError:
+        pass
+
+def listdir(dirname: str) -> Dict[str, bool]:
+    """Return {name: is_file} for the entries of a directory.
+
+    Raises OSError like os.scandir when the directory cannot be listed.
+    """
+    global _dirty
+    cache = _load()
+    path = os.path.abspath(dirname or ".")
+    st = os.stat(path)
+    mtime_ns = st.st_mtime_ns
+    ctime_ns = st.st_ctime_ns
+
+    cached = cache.get(path)
+    if (cached is not None and cached["mtime_ns"] == mtime_ns
+            and cached["ctime_ns"] == ctime_ns):
+        # Move to the end as most recently used; persist the new order so
+        # listings hit on every run are not the first to be evicted
+        if next(reversed(cache)) != path:
+            cache[path] = cache.pop(path)
+            _dirty = True
+        _current.add(path)
+        return cached["entries"]
+
+    # The key was read before listing: if the directory changes from here
+    # on, the stored key no longer matches and the next run rescans
+    with os.scandir(path) as it:
+        entries = {entry.name: entry.is_file() for entry in it}
+
+    if time.time_ns() - max(mtime_ns, ctime_ns) > _RACY_WINDOW_NS:
+        cache[path] = {"mtime_ns": mtime_ns, "ctime_ns": ctime_ns,
+                       "entries": entries, "misses": []}
+        _current.add(path)
+        _dirty = True
+    else:
+        _current.discard(path)
+
+    return entries
+
+def known_misses(dirname: str) -> FrozenSet[str]:
+    """Return patterns recorded as matching nothing in the current listing.
+
+    Only meaningful after listdir(dirname) in the same run.
+    """
+    path = os.path.abspath(dirname or ".")
+    if path not in _current:
+        return frozenset()
+    return frozenset(_load()[path]["misses"])
+
+def store_misses(dirname: str, misses: Iterable[str]):
+    """Record patterns that matched nothing in the listing from listdir.
+
+    Dropped when that listing was not cacheable (recently modified directory).
+    """
+    global _dirty
+    path = os.path.abspath(dirname or ".")
+    if path not in _current:
+        return
+    _load()[path]["misses"] = sorted(misses)
+    _dirty = True
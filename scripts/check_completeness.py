@@ -7,9 +7,89 @@ Protocol: Zero Tolerance v3.0
 Verifies that all required validation components are present and complete.
 """
 
+import ctypes
+import errno
 import os
 import sys
-from typing import List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+
+import _fscache
+
+# statx(2) constants (linux/fcntl.h, linux/stat.h)
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_TYPE = 0x0001
+_STATX_BUF_SIZE = 256
+
+# None until first probe, then the libc statx function or False if unusable
+_statx = None
+
+def _load_statx():
+    """Resolve libc statx once; False when unavailable on this platform"""
+    global _statx
+    if _statx is None:
+        _statx = False
+        if sys.platform.startswith("linux"):
+            try:
+                libc = ctypes.CDLL("libc.so.6", use_errno=True)
+                _statx = libc.statx
+            except (OSError, AttributeError):
+                pass
+            else:
+                _statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int,
+                                   ctypes.c_uint, ctypes.c_void_p]
+                _statx.restype = ctypes.c_int
+    return _statx
+
+def _statx_exists(path: str) -> bool:
+    """Check existence with statx, requesting only the file type from cache.
+    
+    Falls back to an F_OK access check where statx is unavailable.
+    """
+    global _statx
+    statx = _load_statx()
+    if statx:
+        buf = ctypes.create_string_buffer(_STATX_BUF_SIZE)
+        if statx(_AT_FDCWD, os.fsencode(path), _AT_STATX_DONT_SYNC,
+                 _STATX_TYPE, buf) == 0:
+            return True
+        if ctypes.get_errno() != errno.ENOSYS:
+            return False
+        _statx = False
+    # faccessat(F_OK) answers existence without copying stat fields back
+    return os.access(path, os.F_OK, follow_symlinks=True)
+
+# Required files per category: directory and its (basename, description) entries
+CHECKS: Dict[str, Tuple[str, List[Tuple[str, str]]]] = {
+    "Validation Framework": ("src/validation", [
+        ("tcde_capability_validator.h", "Capability Validator Header"),
+        ("tcde_capability_validator.c", "Capability Validator Implementation"),
+        ("tcde_statistical_validator.h", "Statistical Validator Header"),
+        ("tcde_statistical_validator.c", "Statistical Validator Implementation"),
+    ]),
+    "Test Executables": ("tests", [
+        ("test_consciousness_complete", "Consciousness Tests"),
+        ("test_temporality_complete", "Temporality Tests"),
+        ("test_intentionality_complete", "Intentionality Tests"),
+        ("test_creativity_complete", "Creativity Tests"),
+        ("test_autopoiesis_complete", "Autopoiesis Tests"),
+        ("test_emergence_complete", "Emergence Tests"),
+        ("test_memory_complete", "Memory Tests"),
+        ("test_geometry_complete", "Geometry Tests"),
+        ("test_coupling_complete", "Coupling Tests"),
+        ("test_multimodality_complete", "Multimodality Tests"),
+    ]),
+    "Automation Scripts": ("scripts", [
+        ("run_complete_validation.sh", "Master Test Runner"),
+        ("collect_validation_results.py", "Results Collector"),
+        ("check_completeness.py", "Completeness Checker"),
+    ]),
+    "Documentation": (".kiro/specs/tcde-complete-validation", [
+        ("requirements.md", "Requirements Document"),
+        ("design.md", "Design Document"),
+        ("tasks.md", "Tasks Document"),
+    ]),
+}
 
 class CompletenessChecker:
     """Checks completeness of validation package"""
@@ -18,156 +98,158 @@ class CompletenessChecker:
         self.required_files = []
         self.missing_files = []
         self.present_files = []
+        self._dir_cache: Dict[str, Optional[Set[str]]] = {}
+        # Output is buffered and written once unless a terminal is watching
+        self._live = sys.stdout.isatty()
+        self._buf: List[str] = []
     
-    def check_file(self, filepath: str, description: str) -> bool:
-        """Check if a file exists"""
-        exists = os.path.exists(filepath)
+    def emit(self, line: str):
+        """Queue a line of output, or write it at once on a terminal"""
+        if self._live:
+            sys.stdout.write(line + "\n")
+        else:
+            self._buf.append(line)
+    
+    def flush(self):
+        """Write all buffered output in a single call"""
+        if self._buf:
+            sys.stdout.write("\n".join(self._buf) + "\n")
+            self._buf.clear()
+        sys.stdout.flush()
+    
+    def _list_dir(self, dirname: str) -> Optional[Set[str]]:
+        """Return entry names of a directory, scanning it at most once.
         
+        None means the directory exists but cannot be listed.
+        """
+        if dirname not in self._dir_cache:
+            try:
+                names = set(_fscache.listdir(dirname))
+            except (FileNotFoundError, NotADirectoryError):
+                names = set()
+            except PermissionError:
+                names = None
+            self._dir_cache[dirname] = names
+        return self._dir_cache[dirname]
+    
+    def _record(self, filepath: str, description: str, exists: bool) -> bool:
+        """Record and print the outcome of a presence check"""
         if exists:
             self.present_files.append((filepath, description))
-            print(f"✓ {description}: {filepath}")
+            self.emit(f"✓ {description}: {filepath}")
         else:
             self.missing_files.append((filepath, description))
-            print(f"✗ {description}: {filepath} [MISSING]")
+            self.emit(f"✗ {description}: {filepath} [MISSING]")
         
         return exists
     
-    def check_validation_framework(self) -> bool:
-        """Check validation framework files"""
-        print("\n=== Validation Framework ===")
-        
-        all_present = True
-        all_present &= self.check_file(
-            "src/validation/tcde_capability_validator.h",
-            "Capability Validator Header"
-        )
-        all_present &= self.check_file(
-            "src/validation/tcde_capability_validator.c",
-            "Capability Validator Implementation"
-        )
-        all_present &= self.check_file(
-            "src/validation/tcde_statistical_validator.h",
-            "Statistical Validator Header"
-        )
-        all_present &= self.check_file(
-            "src/validation/tcde_statistical_validator.c",
-            "Statistical Validator Implementation"
-        )
+    def check_file(self, filepath: str, description: str) -> bool:
+        """Check if a file exists"""
+        dirname, basename = os.path.split(filepath)
+        names = self._list_dir(dirname)
+        if names is None:
+            exists = _statx_exists(filepath)
+        else:
+            exists = basename in names
         
-        return all_present
+        return self._record(filepath, description, exists)
     
-    def check_test_executables(self) -> Tuple[int, int]:
-        """Check test executable files"""
-        print("\n=== Test Executables ===")
-        
-        test_categories = [
-            ("tests/test_consciousness_complete", "Consciousness Tests"),
-            ("tests/test_temporality_complete", "Temporality Tests"),
-            ("tests/test_intentionality_complete", "Intentionality Tests"),
-            ("tests/test_creativity_complete", "Creativity Tests"),
-            ("tests/test_autopoiesis_complete", "Autopoiesis Tests"),
-            ("tests/test_emergence_complete", "Emergence Tests"),
-            ("tests/test_memory_complete", "Memory Tests"),
-            ("tests/test_geometry_complete", "Geometry Tests"),
-            ("tests/test_coupling_complete", "Coupling Tests"),
-            ("tests/test_multimodality_complete", "Multimodality Tests"),
-        ]
+    def check_files_in(self, dirname: str,
+                       entries: List[Tuple[str, str]]) -> int:
+        """Check (basename, description) entries against one directory listing.
         
+        Returns the number of entries present.
+        """
+        names = self._list_dir(dirname)
         present = 0
-        total = len(test_categories)
         
-        for test_path, description in test_categories:
-            if self.check_file(test_path, description):
-                present += 1
+        for basename, description in entries:
+            filepath = f"{dirname}/{basename}"
+            if names is None:
+                exists = _statx_exists(filepath)
+            else:
+                exists = basename in names
+            present += self._record(filepath, description, exists)
+        
+        return present
+    
+    def check_category(self, category: str) -> Tuple[int, int]:
+        """Check one category of CHECKS; returns (present, total)"""
+        self.emit(f"\n=== {category} ===")
         
-        return present, total
+        dirname, entries = CHECKS[category]
+        return self.check_files_in(dirname, entries), len(entries)
+    
+    def check_all(self) -> Dict[str, Tuple[int, int]]:
+        """Check every category of CHECKS in order"""
+        return {category: self.check_category(category) for category in CHECKS}
+    
+    def check_validation_framework(self) -> bool:
+        """Check validation framework files"""
+        present, total = self.check_category("Validation Framework")
+        return present == total
+    
+    def check_test_executables(self) -> Tuple[int, int]:
+        """Check test executable files"""
+        return self.check_category("Test Executables")
     
     def check_scripts(self) -> bool:
         """Check automation scripts"""
-        print("\n=== Automation Scripts ===")
-        
-        all_present = True
-        all_present &= self.check_file(
-            "scripts/run_complete_validation.sh",
-            "Master Test Runner"
-        )
-        all_present &= self.check_file(
-            "scripts/collect_validation_results.py",
-            "Results Collector"
-        )
-        all_present &= self.check_file(
-            "scripts/check_completeness.py",
-            "Completeness Checker"
-        )
-        
-        return all_present
+        present, total = self.check_category("Automation Scripts")
+        return present == total
     
     def check_documentation(self) -> bool:
         """Check documentation files"""
-        print("\n=== Documentation ===")
-        
-        all_present = True
-        all_present &= self.check_file(
-            ".kiro/specs/tcde-complete-validation/requirements.md",
-            "Requirements Document"
-        )
-        all_present &= self.check_file(
-            ".kiro/specs/tcde-complete-validation/design.md",
-            "Design Document"
-        )
-        all_present &= self.check_file(
-            ".kiro/specs/tcde-complete-validation/tasks.md",
-            "Tasks Document"
-        )
-        
-        return all_present
+        present, total = self.check_category("Documentation")
+        return present == total
     
     def generate_report(self):
         """Generate completeness report"""
-        print("\n" + "="*60)
-        print("COMPLETENESS REPORT")
-        print("="*60)
+        self.emit("\n" + "="*60)
+        self.emit("COMPLETENESS REPORT")
+        self.emit("="*60)
         
         total_required = len(self.present_files) + len(self.missing_files)
         present_count = len(self.present_files)
         missing_count = len(self.missing_files)
         
-        print(f"\nTotal Required Files: {total_required}")
-        print(f"Present: {present_count}")
-        print(f"Missing: {missing_count}")
-        print(f"Completeness: {(present_count/total_required)*100:.2f}%")
+        self.emit(f"\nTotal Required Files: {total_required}")
+        self.emit(f"Present: {present_count}")
+        self.emit(f"Missing: {missing_count}")
+        self.emit(f"Completeness: {(present_count/total_required)*100:.2f}%")
         
         if missing_count > 0:
-            print("\n⚠ Missing Files:")
+            self.emit("\n⚠ Missing Files:")
             for filepath, description in self.missing_files:
-                print(f"  - {description}: {filepath}")
+                self.emit(f"  - {description}: {filepath}")
         
-        print("\n" + "="*60)
+        self.emit("\n" + "="*60)
         
         if missing_count == 0:
-            print("✓ PACKAGE COMPLETE")
+            self.emit("✓ PACKAGE COMPLETE")
             return True
         else:
-            print("✗ PACKAGE INCOMPLETE")
+            self.emit("✗ PACKAGE INCOMPLETE")
             return False
 
 def main():
     """Main execution"""
     
-    print("TCDE Complete Validation - Completeness Check")
-    print("Protocol: Zero Tolerance v3.0")
-    print("="*60)
-    
     checker = CompletenessChecker()
     
-    # Check all components
-    framework_complete = checker.check_validation_framework()
-    tests_present, tests_total = checker.check_test_executables()
-    scripts_complete = checker.check_scripts()
-    docs_complete = checker.check_documentation()
-    
-    # Generate report
-    is_complete = checker.generate_report()
+    # Buffered output is written even if a check raises
+    try:
+        checker.emit("TCDE Complete Validation - Completeness Check")
+        checker.emit("Protocol: Zero Tolerance v3.0")
+        checker.emit("="*60)
+        
+        # Check all components
+        checker.check_all()
+        
+        # Generate report
+        is_complete = checker.generate_report()
+    finally:
+        checker.flush()
     
     # Exit with appropriate code
     sys.exit(0 if is_complete else 1)
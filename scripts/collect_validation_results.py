@@ -13,8 +13,56 @@ import os
 import sys
 import glob
 from datetime import datetime
-from typing import Dict, List, Any
-import statistics
+from typing import Any, Dict, Final, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Only the end of each test log is embedded in the report
+TEST_OUTPUT_TAIL_BYTES = 2048
+
+# All 31 capabilities: (id, name, test output file)
+_CAPABILITIES: Final[Tuple[Tuple[int, str, str], ...]] = (
+    (3, "Cosmic Consciousness", "consciousness_complete_output.txt"),
+    (4, "Meta-Cognition", "consciousness_complete_output.txt"),
+    (5, "Self-Representation", "consciousness_complete_output.txt"),
+    (7, "Bi-Temporal Control", "temporality_complete_output.txt"),
+    (8, "Prediction", "temporality_complete_output.txt"),
+    (9, "Temporal Evolution", "temporality_complete_output.txt"),
+    (12, "Curiosity", "intentionality_complete_output.txt"),
+    (13, "Intentional Force", "intentionality_complete_output.txt"),
+    (14, "Intentional Coherence", "intentionality_complete_output.txt"),
+    (15, "Autonomous Decisions", "intentionality_complete_output.txt"),
+    (17, "Novelty", "creativity_complete_output.txt"),
+    (18, "Originality", "creativity_complete_output.txt"),
+    (22, "Autopoietic Health", "autopoiesis_complete_output.txt"),
+    (25, "Metric Adaptation", "emergence_complete_output.txt"),
+    (26, "Turing Instability", "emergence_complete_output.txt"),
+    (27, "Criticality", "emergence_complete_output.txt"),
+    (30, "Consolidation", "memory_complete_output.txt"),
+    (31, "Selective Forgetting", "memory_complete_output.txt"),
+    (32, "Associative Retrieval", "memory_complete_output.txt"),
+    (33, "Memory Hierarchy", "memory_complete_output.txt"),
+    (34, "Geodesic Intuition", "geometry_complete_output.txt"),
+    (35, "Topological Torsion", "geometry_complete_output.txt"),
+    (36, "Topological Formation", "geometry_complete_output.txt"),
+    (37, "Adaptive Curvature", "geometry_complete_output.txt"),
+    (39, "Global Coupling", "coupling_complete_output.txt"),
+    (40, "Spatial Coherence", "coupling_complete_output.txt"),
+    (41, "Phase Synchronization", "coupling_complete_output.txt"),
+    (42, "Unified Consciousness", "coupling_complete_output.txt"),
+    (43, "Modal Transformation", "multimodality_complete_output.txt"),
+    (44, "Cross-Modal Coherence", "multimodality_complete_output.txt"),
+    (45, "Cross-Modal Similarity", "multimodality_complete_output.txt"),
+)
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
 
 class ValidationResultsCollector:
     """Collects and analyzes validation results"""
@@ -31,6 +79,17 @@ class ValidationResultsCollector:
             "statistics": {},
             "compliance": {}
         }
+        
+        # Per-capability columns; zipped into results["capabilities"] only
+        # when the report is serialized
+        self._ids: List[int] = []
+        self._names: List[str] = []
+        self._status: List[str] = []
+        self._score: List[float] = []
+        self._passed: List[bool] = []
+        self._statistical_validation: List[Dict[str, Any]] = []
+        self._test_output_path: List[str] = []
+        self._test_output_tail: List[str] = []
     
     def collect_capability_results(self, capability_id: int, 
                                    capability_name: str,
@@ -43,40 +102,108 @@ class ValidationResultsCollector:
             "status": "NOT_TESTED",
             "score": 0.0,
             "statistical_validation": {},
-            "test_output": ""
+            "test_output_path": "",
+            "test_output_tail": ""
         }
         
-        # Read test output if available
+        # Reference the test output by path and keep only its tail
         output_path = os.path.join(self.results_dir, test_output_file)
-        if os.path.exists(output_path):
-            with open(output_path, 'r') as f:
-                result["test_output"] = f.read()
-                result["status"] = "TESTED"
+        try:
+            fd = os.open(output_path, os.O_RDONLY)
+        except FileNotFoundError:
+            return result
+        
+        try:
+            size = os.fstat(fd).st_size
+            tail_size = min(size, TEST_OUTPUT_TAIL_BYTES)
+            os.lseek(fd, size - tail_size, os.SEEK_SET)
+            tail = os.read(fd, tail_size)
+        finally:
+            os.close(fd)
+        
+        result["test_output_tail"] = tail.decode('utf-8', 'replace')
+        result["test_output_path"] = output_path
+        result["status"] = "TESTED"
         
         return result
     
+    def add_capability_result(self, result: Dict[str, Any]):
+        """Append a collected capability result to the column store"""
+        
+        self._ids.append(result["capability_id"])
+        self._names.append(result["capability_name"])
+        self._status.append(result["status"])
+        self._score.append(result.get("score", 0.0))
+        self._passed.append(result.get("passed", False))
+        self._statistical_validation.append(result["statistical_validation"])
+        self._test_output_path.append(result["test_output_path"])
+        self._test_output_tail.append(result["test_output_tail"])
+    
+    def capability_records(self) -> List[Dict[str, Any]]:
+        """Build the per-capability records of the report schema"""
+        
+        return [
+            {
+                "capability_id": cap_id,
+                "capability_name": name,
+                "status": status,
+                "score": score,
+                "statistical_validation": stat_validation,
+                "test_output_path": output_path,
+                "test_output_tail": output_tail
+            }
+            for (cap_id, name, status, score, stat_validation,
+                 output_path, output_tail)
+            in zip(self._ids, self._names, self._status, self._score,
+                   self._statistical_validation, self._test_output_path,
+                   self._test_output_tail)
+        ]
+    
     def compute_statistics(self, scores: List[float]) -> Dict[str, float]:
         """Compute statistical metrics from scores"""
         
         if not scores:
             return {}
         
+        # Single pass: Welford's update for mean/variance, plus min/max
+        n = 0
+        mean = 0.0
+        m2 = 0.0
+        lo = float("inf")
+        hi = float("-inf")
+        for x in scores:
+            n += 1
+            delta = x - mean
+            mean += delta / n
+            m2 += delta * (x - mean)
+            if x < lo:
+                lo = x
+            if x > hi:
+                hi = x
+        
+        ordered = sorted(scores)
+        mid = n // 2
+        median = ordered[mid] if n % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+        
         return {
-            "mean": statistics.mean(scores),
-            "median": statistics.median(scores),
-            "stdev": statistics.stdev(scores) if len(scores) > 1 else 0.0,
-            "min": min(scores),
-            "max": max(scores),
-            "count": len(scores)
+            "mean": mean,
+            "median": median,
+            "stdev": (m2 / (n - 1)) ** 0.5 if n > 1 else 0.0,
+            "min": lo,
+            "max": hi,
+            "count": n
         }
     
     def check_compliance(self) -> Dict[str, Any]:
         """Check Zero Tolerance compliance"""
         
-        tested_count = sum(1 for c in self.results["capabilities"] 
-                          if c["status"] == "TESTED")
-        passed_count = sum(1 for c in self.results["capabilities"]
-                          if c["status"] == "TESTED" and c.get("passed", False))
+        tested_count = 0
+        passed_count = 0
+        for status, passed in zip(self._status, self._passed):
+            if status == "TESTED":
+                tested_count += 1
+                if passed:
+                    passed_count += 1
         
         return {
             "total_capabilities": 31,
@@ -93,8 +220,9 @@ class ValidationResultsCollector:
         """Generate comprehensive validation report"""
         
         # Compute statistics
-        scores = [c.get("score", 0.0) for c in self.results["capabilities"]
-                 if c["status"] == "TESTED"]
+        scores = [score for s, score in zip(self._status, self._score)
+                  if s == "TESTED"]
+        self.results["capabilities"] = self.capability_records()
         self.results["statistics"] = self.compute_statistics(scores)
         
         # Check compliance
@@ -102,8 +230,8 @@ class ValidationResultsCollector:
         
         # Write JSON output
         output_path = os.path.join(self.results_dir, output_file)
-        with open(output_path, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(_dumps(self.results))
         
         print(f"✓ Validation report generated: {output_path}")
         
@@ -154,45 +282,10 @@ def main():
     # Initialize collector
     collector = ValidationResultsCollector()
     
-    # Define all 31 capabilities
-    capabilities = [
-        (3, "Cosmic Consciousness", "consciousness_complete_output.txt"),
-        (4, "Meta-Cognition", "consciousness_complete_output.txt"),
-        (5, "Self-Representation", "consciousness_complete_output.txt"),
-        (7, "Bi-Temporal Control", "temporality_complete_output.txt"),
-        (8, "Prediction", "temporality_complete_output.txt"),
-        (9, "Temporal Evolution", "temporality_complete_output.txt"),
-        (12, "Curiosity", "intentionality_complete_output.txt"),
-        (13, "Intentional Force", "intentionality_complete_output.txt"),
-        (14, "Intentional Coherence", "intentionality_complete_output.txt"),
-        (15, "Autonomous Decisions", "intentionality_complete_output.txt"),
-        (17, "Novelty", "creativity_complete_output.txt"),
-        (18, "Originality", "creativity_complete_output.txt"),
-        (22, "Autopoietic Health", "autopoiesis_complete_output.txt"),
-        (25, "Metric Adaptation", "emergence_complete_output.txt"),
-        (26, "Turing Instability", "emergence_complete_output.txt"),
-        (27, "Criticality", "emergence_complete_output.txt"),
-        (30, "Consolidation", "memory_complete_output.txt"),
-        (31, "Selective Forgetting", "memory_complete_output.txt"),
-        (32, "Associative Retrieval", "memory_complete_output.txt"),
-        (33, "Memory Hierarchy", "memory_complete_output.txt"),
-        (34, "Geodesic Intuition", "geometry_complete_output.txt"),
-        (35, "Topological Torsion", "geometry_complete_output.txt"),
-        (36, "Topological Formation", "geometry_complete_output.txt"),
-        (37, "Adaptive Curvature", "geometry_complete_output.txt"),
-        (39, "Global Coupling", "coupling_complete_output.txt"),
-        (40, "Spatial Coherence", "coupling_complete_output.txt"),
-        (41, "Phase Synchronization", "coupling_complete_output.txt"),
-        (42, "Unified Consciousness", "coupling_complete_output.txt"),
-        (43, "Modal Transformation", "multimodality_complete_output.txt"),
-        (44, "Cross-Modal Coherence", "multimodality_complete_output.txt"),
-        (45, "Cross-Modal Similarity", "multimodality_complete_output.txt"),
-    ]
-    
     # Collect results for each capability
-    for cap_id, cap_name, output_file in capabilities:
+    for cap_id, cap_name, output_file in _CAPABILITIES:
         result = collector.collect_capability_results(cap_id, cap_name, output_file)
-        collector.results["capabilities"].append(result)
+        collector.add_capability_result(result)
     
     # Generate report
     collector.generate_report()
@@ -4,9 +4,16 @@ TCDE Documentation Translation Script
 Translates all French documentation files to English
 """
 
+import fnmatch
+import mmap
 import os
 import re
-import glob
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "scripts"))
+import _fscache
 
 # French to English translations for common TCDE terms
 TRANSLATIONS = {
@@ -94,31 +101,101 @@ TRANSLATIONS = {
     "tests/": "tests/",
 }
 
-def translate_text(text):
-    """Apply basic French to English translations"""
-    for french, english in TRANSLATIONS.items():
-        text = text.replace(french, english)
-    return text
+# Identity entries never change the text, so they are left out of the pattern.
+# Longest keys come first so "Métriques" wins over its prefix "Métrique".
+# Terms only match as whole words, optionally followed by a plural "s" that is
+# carried over ("Systèmes" -> "Systems") - so "Complet" no longer hits English
+# "Complete". Lookarounds are used instead of \b as some keys start with "#".
+_LOOKUP = {french: english for french, english in TRANSLATIONS.items()
+           if french != english}
+_KEYS = sorted(_LOOKUP, key=len, reverse=True)
+_PATTERN = re.compile(
+    r'(?<!\w)(' + '|'.join(re.escape(french) for french in _KEYS)
+    + r')(s?)(?!\w)')
+# Same alternation over UTF-8 bytes, to probe files before decoding them. Its
+# ASCII-only \w makes it match a superset of _PATTERN, so no file is missed.
+_BYTES_PATTERN = re.compile(
+    rb'(?<!\w)(?:'
+    + b'|'.join(re.escape(french.encode('utf-8')) for french in _KEYS)
+    + rb')s?(?!\w)', re.DOTALL)
+
+def find_files(patterns):
+    """Match patterns against a single listing of the current directory.
+    
+    Patterns that matched nothing are remembered with the cached listing and
+    skipped until the directory changes.
+    """
+    # Like glob, skip hidden entries; only regular files can be translated
+    names = [name for name, is_file in _fscache.listdir('.').items()
+             if is_file and not name.startswith('.')]
+    
+    known_misses = _fscache.known_misses('.')
+    active = [p for p in patterns if p not in known_misses]
+    
+    matched = set()
+    misses = set(known_misses)
+    for pattern in active:
+        hits = fnmatch.filter(names, pattern)
+        if hits:
+            matched.update(hits)
+        else:
+            misses.add(pattern)
+    
+    if misses != known_misses:
+        _fscache.store_misses('.', misses)
+    
+    return sorted(matched)
+
+def _replace(match, _get=_LOOKUP.__getitem__):
+    """Map one matched French term to its English translation"""
+    return _get(match.group(1)) + match.group(2)
+
+# Bound methods are pinned as defaults so each call uses fast locals
+def translate_text(text, _sub=_PATTERN.sub, _replace=_replace):
+    """Apply basic French to English translations in a single pass"""
+    return _sub(_replace, text)
+
+# translate_file outcomes
+TRANSLATED = "translated"
+NO_TERMS = "no_terms"
+UNCHANGED = "unchanged"
 
 def translate_file(filepath):
-    """Translate a single file from French to English"""
-    print(f"Translating: {filepath}")
+    """Translate a single file from French to English.
     
+    Returns (filepath, status, error) where status is one of TRANSLATED,
+    NO_TERMS or UNCHANGED and error is None on success; runs in a worker
+    process, so reporting is left to the caller.
+    """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Probe the raw bytes first: files without any French term are
+        # neither decoded nor rewritten
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return filepath, NO_TERMS, None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if _BYTES_PATTERN.search(mm) is None:
+                    return filepath, NO_TERMS, None
+                content = mm[:].decode('utf-8')
         
-        # Apply translations
+        # Apply translations; a no-op result leaves the file and its mtime alone
         translated_content = translate_text(content)
+        if translated_content == content:
+            return filepath, UNCHANGED, None
         
         # Write back translated content
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(translated_content)
-            
-        print(f"✅ Translated: {filepath}")
+        data = memoryview(translated_content.encode('utf-8'))
+        fd = os.open(filepath, os.O_WRONLY | os.O_TRUNC | os.O_CREAT, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        
+        return filepath, TRANSLATED, None
         
     except Exception as e:
-        print(f"❌ Error translating {filepath}: {e}")
+        return filepath, None, str(e)
 
 def main():
     """Main translation function"""
@@ -149,12 +226,7 @@ def main():
         "STATUT_*.md"
     ]
     
-    files_to_translate = []
-    for pattern in french_patterns:
-        files_to_translate.extend(glob.glob(pattern))
-    
-    # Remove duplicates
-    files_to_translate = list(set(files_to_translate))
+    files_to_translate = find_files(french_patterns)
     
     print(f"Found {len(files_to_translate)} files to translate:")
     for f in files_to_translate:
@@ -163,10 +235,19 @@ def main():
     print("\nStarting translation...")
     
     translated_count = 0
-    for filepath in files_to_translate:
-        if os.path.exists(filepath):
-            translate_file(filepath)
-            translated_count += 1
+    with ProcessPoolExecutor() as executor:
+        for filepath, status, error in executor.map(translate_file,
+                                                    files_to_translate,
+                                                    chunksize=4):
+            if error is not None:
+                print(f"❌ Error translating {filepath}: {error}")
+            elif status == TRANSLATED:
+                print(f"✅ Translated: {filepath}")
+                translated_count += 1
+            elif status == UNCHANGED:
+                print(f"∅ unchanged: {filepath}")
+            else:
+                print(f"⏭ No French terms: {filepath}")
     
     print(f"\n✅ Translation completed!")
     print(f"📊 Files translated: {translated_count}/{len(files_to_translate)}")